@@ -1,24 +1,27 @@
 # Configuration and constants
 
-# Court URLs (iCal Feeds)
-COURTS = {
-    "Court 1": "https://25live.collegenet.com/25live/data/psu/run/rm_reservations.ics?caller=pro&space_id=6451&start_dt=-30&end_dt=+180&options=standard",
-    "Court 2": "https://25live.collegenet.com/25live/data/psu/run/rm_reservations.ics?caller=pro&space_id=6452&start_dt=-30&end_dt=+180&options=standard",
-    "Court 3": "https://25live.collegenet.com/25live/data/psu/run/rm_reservations.ics?caller=pro&space_id=105&start_dt=-30&end_dt=+180&options=standard",
-}
+from types import MappingProxyType
 
-# Operating hours
-# Operating hours (Day of week: (Open, Close))
-# Monday=0, Sunday=6
-OPERATING_HOURS = {
-    0: (6, 23),   # Mon: 6 AM - 11 PM
-    1: (6, 23),   # Tue: 6 AM - 11 PM
-    2: (6, 23),   # Wed: 6 AM - 11 PM
-    3: (6, 23),   # Thu: 6 AM - 11 PM
-    4: (6, 22),   # Fri: 6 AM - 10 PM
-    5: (10, 22),  # Sat: 10 AM - 10 PM
-    6: (12, 23),  # Sun: 12 PM - 11 PM
-}
+# Court URLs (iCal Feeds), read-only
+# start_dt/end_dt are days relative to 25Live's today; the report covers the
+# next 7 days, with a day of slack each side for clock/bound differences
+COURTS = MappingProxyType({
+    "Court 1": "https://25live.collegenet.com/25live/data/psu/run/rm_reservations.ics?caller=pro&space_id=6451&start_dt=-1&end_dt=+8&options=standard",
+    "Court 2": "https://25live.collegenet.com/25live/data/psu/run/rm_reservations.ics?caller=pro&space_id=6452&start_dt=-1&end_dt=+8&options=standard",
+    "Court 3": "https://25live.collegenet.com/25live/data/psu/run/rm_reservations.ics?caller=pro&space_id=105&start_dt=-1&end_dt=+8&options=standard",
+})
+
+# Operating hours (Open, Close), indexed by day of week
+# Monday=0, Sunday=6 (matches date.weekday())
+OPERATING_HOURS = (
+    (6, 23),   # Mon: 6 AM - 11 PM
+    (6, 23),   # Tue: 6 AM - 11 PM
+    (6, 23),   # Wed: 6 AM - 11 PM
+    (6, 23),   # Thu: 6 AM - 11 PM
+    (6, 22),   # Fri: 6 AM - 10 PM
+    (10, 22),  # Sat: 10 AM - 10 PM
+    (12, 23),  # Sun: 12 PM - 11 PM
+)
 
 # Keyring service name for secure storage
 KEYRING_SERVICE = "erie-hall-widget"
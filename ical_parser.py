@@ -5,131 +5,149 @@ Replaces the Selenium scraper for faster, safer access.
 
 import requests
 import re
-from ics import Calendar
-from datetime import datetime, timedelta
-import pytz
+from bisect import insort
+from icalendar import Calendar
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
 from config import OPERATING_HOURS
 
 # PSU usually operates on Eastern Time
-EASTERN = pytz.timezone("America/New_York")
+EASTERN = ZoneInfo("America/New_York")
+_UTC = ZoneInfo("UTC")
 
+# Case-insensitive match without allocating a lowercased copy of every title
+_BADMINTON = re.compile(r'badminton', re.IGNORECASE)
 
-def get_arrow_or_datetime_in_eastern(dt_obj):
+# English names for format_date, independent of the process locale
+_DAY_NAMES = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+_MONTH_NAMES = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+
+def to_eastern(dt_obj):
     """
-    Helper to convert either Arrow object (old ics) or datetime (new ics)
-    to a datetime object in Eastern time.
+    Convert a decoded DTSTART/DTEND value to a datetime in Eastern time.
+    All-day values (plain dates) and missing values return None.
     """
-    if dt_obj is None:
+    if not isinstance(dt_obj, datetime):
         return None
-        
-    # If it's an Arrow object
-    if hasattr(dt_obj, 'to'):
-        return dt_obj.to('US/Eastern').datetime
-    
-    # If it's a datetime object
-    if isinstance(dt_obj, datetime):
-        if dt_obj.tzinfo is None:
-            # Assume UTC if naive, though ics usually provides awareness
-            dt_obj = pytz.utc.localize(dt_obj)
-        return dt_obj.astimezone(EASTERN)
-        
-    return None
+
+    if dt_obj.tzinfo is None:
+        # Assume UTC if naive, though 25Live feeds are tz-aware
+        dt_obj = dt_obj.replace(tzinfo=_UTC)
+    return dt_obj.astimezone(EASTERN)
 
 
-def fetch_ical_data(ical_url):
+def fetch_ical_data(ical_url, court_name):
     """
-    Fetch and parse the iCal feed.
+    Fetch and parse the iCal feed for one court.
+    court_name labels the log lines, since courts are fetched concurrently.
     Returns (gaps_dict, badminton_list).
     """
-    print(f"  Fetching iCal feed...")
+    print(f"  Fetching {court_name} iCal feed...")
     try:
-        response = requests.get(ical_url)
+        response = requests.get(ical_url, timeout=(5, 30))
         response.raise_for_status()
-        c = Calendar(response.text)
+        c = Calendar.from_ical(response.content)
     except Exception as e:
-        print(f"  Error fetching iCal data: {e}")
+        print(f"  Error fetching {court_name} iCal data: {e}")
         return {}, []
 
     # Get today's date to filter out old events if needed
     now = datetime.now(EASTERN)
     today = now.date()
 
-    events_by_day = {}
+    events_by_day = {}  # keyed by date; formatted only when writing output
     badminton_events = []
 
     # Iterate through all events in the calendar
-    for event in c.events:
-        start_dt = get_arrow_or_datetime_in_eastern(event.begin)
-        end_dt = get_arrow_or_datetime_in_eastern(event.end)
-        
-        if not start_dt or not end_dt:
-            continue
+    for event in c.walk('VEVENT'):
+        begin = event.decoded('dtstart', None)
+        end = event.decoded('dtend', None)
+        if end is None and begin is not None and 'duration' in event:
+            end = begin + event.decoded('duration')
+
+        start_dt = to_eastern(begin)
+        end_dt = to_eastern(end)
+        name = str(event.get('summary', ''))
+
+        # All-day (VALUE=DATE) reservations block the full operating hours of
+        # every day they cover; DTEND is exclusive and defaults to the next day
+        if isinstance(begin, date) and not isinstance(begin, datetime):
+            if isinstance(end, date) and not isinstance(end, datetime) and end > begin:
+                last_day = end
+            else:
+                last_day = begin + timedelta(days=1)
+            spans = []
+            day = max(begin, today)
+            while day < last_day:
+                open_h, close_h = OPERATING_HOURS[day.weekday()]
+                spans.append((day, open_h, close_h))
+                day += timedelta(days=1)
+        else:
+            if not start_dt or not end_dt:
+                continue
+                
+            # Skip past events (before today)
+            day = start_dt.date()
+            if day < today:
+                continue
+
+            # Calculate float hours for existing logic
+            start_hour = start_dt.hour + (start_dt.minute / 60.0)
+            end_hour = end_dt.hour + (end_dt.minute / 60.0)
+            if end_dt.date() > day:
+                # Runs to (or past) midnight: clamp to the end of this day
+                end_hour = 24.0
+            spans = [(day, start_hour, end_hour)]
+
+        for day, start_hour, end_hour in spans:
+            # -- Store for Gap Calculation --
+            # Plain (start, end) tuples kept sorted on insert; the feed is roughly
+            # chronological, so this is usually an append
+            if day not in events_by_day:
+                events_by_day[day] = []
             
-        # Skip past events (before today)
-        if start_dt.date() < today:
-            continue
-
-        date_str = start_dt.strftime('%a %b %d %Y')  # e.g. "Mon Jan 19 2026"
-        
-        # Calculate float hours for existing logic
-        start_hour = start_dt.hour + (start_dt.minute / 60.0)
-        end_hour = end_dt.hour + (end_dt.minute / 60.0)
-
-        # -- Store for Gap Calculation --
-        if date_str not in events_by_day:
-            events_by_day[date_str] = []
-        
-        events_by_day[date_str].append({
-            'start': start_hour,
-            'end': end_hour
-        })
-
-        # -- Check for Badminton --
-        # 25Live event titles often contain the event name
-        if event.name and 'badminton' in event.name.lower():
-            badminton_events.append({
-                'name': event.name,
-                'date_str': date_str,
-                'date': start_dt.date(),
-                # Use %I:%M%p (e.g. 09:30AM) to match parse_time regex
-                'start': start_dt.strftime('%I:%M%p').lstrip('0'), 
-                'end': end_dt.strftime('%I:%M%p').lstrip('0'),
-            })
+            insort(events_by_day[day], (start_hour, end_hour))
+
+            # -- Check for Badminton --
+            # 25Live event titles often contain the event name
+            if name and _BADMINTON.search(name):
+                # Report the slot only up to closing time (never "24:00");
+                # the uncapped end is still used for the gap sweep above
+                close_h = OPERATING_HOURS[day.weekday()][1]
+                badminton_events.append({
+                    'name': name,
+                    'date': day,
+                    'start_hour': start_hour,
+                    'end_hour': min(end_hour, close_h),
+                })
 
     # Calculate Gaps (Free Time)
     gaps = {}
     
-    # We need to sort by date for consistency
-    sorted_date_strs = sorted(events_by_day.keys(), key=lambda d: datetime.strptime(d, "%a %b %d %Y"))
-    
-    for date_str in sorted_date_strs:
-        events = events_by_day[date_str]
-        # Sort events by start time
-        events.sort(key=lambda x: x['start'])
-        
-        # Get operating hours for this day of week
-        dt = datetime.strptime(date_str, "%a %b %d %Y")
-        day_of_week = dt.weekday()  # Mon=0, Sun=6
-        open_h, close_h = OPERATING_HOURS.get(day_of_week, (6, 23)) # Default to 6-11 if missing
+    # Day order doesn't matter here; save_results_json sorts by date on output
+    for day, events in events_by_day.items():
+        # Get operating hours for this day of week (Mon=0, Sun=6)
+        open_h, close_h = OPERATING_HOURS[day.weekday()]
 
         day_gaps = []
         current_time = open_h
         
-        for event in events:
+        for start, end in events:
             # If there is space between current_time and event start
-            if event['start'] > current_time:
-                duration = event['start'] - current_time
+            if start > current_time:
+                duration = start - current_time
                 # Only include gaps >= 1 hour
                 if duration >= 1.0:
                     day_gaps.append({
                         'start': current_time, 
-                        'end': event['start'], 
+                        'end': start, 
                         'duration': duration
                     })
             
             # Move current_time pointer if this event extends past it
-            if event['end'] > current_time:
-                current_time = event['end']
+            current_time = max(current_time, end)
         
         # Check for gap at end of day
         if current_time < close_h:
@@ -141,56 +159,20 @@ def fetch_ical_data(ical_url):
                     'duration': duration
                 })
         
-        if day_gaps:
-            gaps[date_str] = day_gaps
+        # Keep fully booked days (no gaps) so main.py doesn't treat them as
+        # event-free and fill them in as open all day
+        gaps[day] = day_gaps
 
     return gaps, badminton_events
 
 
-def parse_time(time_str):
-    """Convert time string like '9:05AM' to hour as float"""
-    if not time_str:
-        return None
-    time_str = time_str.strip().upper()
-    try:
-        if ':' in time_str:
-            match = re.match(r'(\d+):(\d+)(AM|PM)', time_str)
-            if match:
-                hour = int(match.group(1))
-                minute = int(match.group(2))
-                period = match.group(3)
-                if period == 'PM' and hour != 12:
-                    hour += 12
-                elif period == 'AM' and hour == 12:
-                    hour = 0
-                return hour + minute / 60.0
-        else:
-            match = re.match(r'(\d+)(AM|PM)', time_str)
-            if match:
-                hour = int(match.group(1))
-                period = match.group(2)
-                if period == 'PM' and hour != 12:
-                    hour += 12
-                elif period == 'AM' and hour == 12:
-                    hour = 0
-                return float(hour)
-    except:
-        pass
-    return None
-
-
-def parse_date(date_str):
-    """Convert date string like 'Mon Jan 19 2026' to datetime date object"""
-    try:
-        clean_str = date_str.replace(',', '')
-        return datetime.strptime(clean_str, "%a %b %d %Y").date()
-    except ValueError:
-        return None
-
-
 def format_hour(hour):
     """Convert hour float to readable time string"""
     h = int(hour)
     m = int((hour - h) * 60)
     return f"{h:02d}:{m:02d}"
 
+
+def format_date(d):
+    """Convert date object to output string like 'Sun, 25-Jan'"""
+    return f"{_DAY_NAMES[d.weekday()]}, {d.day:02d}-{_MONTH_NAMES[d.month - 1]}"
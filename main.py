@@ -11,11 +11,12 @@ import sys
 import os
 import json
 import time
-from datetime import datetime, timedelta, date
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 
 # No more Selenium imports needed!
 from config import COURTS, OPERATING_HOURS
-from ical_parser import (fetch_ical_data, format_hour, parse_date, parse_time)
+from ical_parser import (EASTERN, fetch_ical_data, format_date, format_hour)
 
 # Detect CI environment
 IS_CI = os.getenv("CI") == "true"
@@ -32,27 +33,16 @@ def save_results_json(all_gaps, all_badminton):
         "courts": {}
     }
     
-    # helper
-    def date_key(d_str):
-        return parse_date(d_str) or date.min
-
     # 1. Merge Badminton events into Gaps
     for event in all_badminton:
         court = event.get('court')
-        d_str = event['date_str']
-        
-        # Parse times to floats for sorting
-        s = parse_time(event['start'])
-        e = parse_time(event['end'])
+        day = event['date']
+        s = event['start_hour']
+        e = event['end_hour']
         
-        if court and d_str and s and e:
-            if court not in all_gaps:
-                all_gaps[court] = {}
-            if d_str not in all_gaps[court]:
-                all_gaps[court][d_str] = []
-                
+        if court and day and e > s:
             # Add as a slot with a note
-            all_gaps[court][d_str].append({
+            all_gaps.setdefault(court, {}).setdefault(day, []).append({
                 'start': s,
                 'end': e,
                 'duration': e - s,
@@ -62,10 +52,9 @@ def save_results_json(all_gaps, all_badminton):
     # 2. Build Output
     for court_name, gaps in all_gaps.items():
         court_data = []
-        sorted_dates = sorted(gaps.keys(), key=date_key)
         
-        for date_str in sorted_dates:
-            day_items = gaps[date_str]
+        for day in sorted(gaps):
+            day_items = gaps[day]
             # Sort by start time
             day_items.sort(key=lambda x: x['start'])
             
@@ -78,12 +67,8 @@ def save_results_json(all_gaps, all_badminton):
                     "note": item.get('note', "Open")
                 })
                 
-            # Format date as "Sun, 25-Jan"
-            d_obj = parse_date(date_str)
-            formatted_date = d_obj.strftime("%a, %d-%b") if d_obj else date_str
-            
             day_data = {
-                "date": formatted_date,
+                "date": format_date(day),  # e.g. "Sun, 25-Jan"
                 "slots": slots_list
             }
             court_data.append(day_data)
@@ -98,18 +83,14 @@ def save_results_json(all_gaps, all_badminton):
 
 def filter_for_week(data_dict, target_start_date, days=7):
     """
-    Filter a dictionary of {date_str: data} to only include dates 
+    Filter a dictionary of {date: data} to only include dates 
     within [target_start_date, target_start_date + 6 days].
     """
-    filtered = {}
     target_end_date = target_start_date + timedelta(days=days-1)
-    
-    for date_str, content in data_dict.items():
-        d = parse_date(date_str)
-        if d and target_start_date <= d <= target_end_date:
-            filtered[date_str] = content
-            
-    return filtered
+    return {
+        d: content for d, content in data_dict.items()
+        if target_start_date <= d <= target_end_date
+    }
 
 
 def main():
@@ -123,18 +104,24 @@ def main():
     all_gaps = {}
     all_badminton = []
     
-    # Define our target window: Today + 6 days
-    today = datetime.now().date()
+    # Define our target window: Today + 6 days, in the feeds' (Eastern) time
+    today = datetime.now(EASTERN).date()
     end_date = today + timedelta(days=6)
     
     print(f"\nScanning courts ({today.strftime('%b %d')} - {end_date.strftime('%b %d')})...")
 
-    # Iterate through courts using the URLs from config.py
-    for court_name, ical_url in COURTS.items():
+    # 1. Fetch all iCal feeds concurrently (URLs are now direct in config.py).
+    # Each fetch is network-bound, so total time is the slowest court, not the sum.
+    with ThreadPoolExecutor(max_workers=len(COURTS)) as executor:
+        futures = {
+            court_name: executor.submit(fetch_ical_data, ical_url, court_name)
+            for court_name, ical_url in COURTS.items()
+        }
+
+    # Process results on the main thread, in config order
+    for court_name, future in futures.items():
         print(f"  Checking {court_name}...")
-        
-        # 1. Fetch from iCal (URLs are now direct in config.py)
-        court_gaps, court_badminton = fetch_ical_data(ical_url)
+        court_gaps, court_badminton = future.result()
         
         # 2. Filter for [Today, Today+6]
         filtered_gaps = filter_for_week(court_gaps, today, 7)
@@ -142,10 +129,9 @@ def main():
         # 3. Add full-day open entry for days with no events at all
         for i in range(7):
             d = today + timedelta(days=i)
-            date_str = d.strftime("%a %b %d %Y")
-            if date_str not in filtered_gaps:
-                open_h, close_h = OPERATING_HOURS.get(d.weekday(), (6, 23))
-                filtered_gaps[date_str] = [{
+            if d not in filtered_gaps:
+                open_h, close_h = OPERATING_HOURS[d.weekday()]
+                filtered_gaps[d] = [{
                     'start': open_h,
                     'end': close_h,
                     'duration': close_h - open_h
@@ -153,21 +139,16 @@ def main():
 
         all_gaps[court_name] = filtered_gaps
         
-        # Merge and filter badminton
-        # Filter by date
-        filtered_badminton = [
-            e for e in court_badminton 
-            if e.get('date') and today <= e['date'] <= end_date
-        ]
-        
-        # Dedup badminton events
+        # Filter badminton to the window and dedup in a single pass
         seen = set()
-        for e in filtered_badminton:
-            key = (e['name'], e['date_str'], e['start'])
+        for e in court_badminton:
+            if not (e.get('date') and today <= e['date'] <= end_date):
+                continue
+            key = (e['name'], e['date'], e['start_hour'])
             if key not in seen:
                 seen.add(key)
                 e['court'] = court_name
-                all_badminton.extend([e])
+                all_badminton.append(e)
     
     save_results_json(all_gaps, all_badminton)
     